@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import sys
 
-from game.daily import get_daily_city, get_all_cities, get_time_until_reset
+from game.daily import get_daily_city, get_all_cities, get_time_until_reset, warmup
 from game.engine import GameState, get_game_summary, start_game, submit_guess
 from map.renderer import get_color_for_tier, render_map_stub
 
@@ -31,49 +31,54 @@ def format_time_remaining(td) -> str:
     return f"{hours}h {minutes}m"
 
 
+_WELCOME_BANNER = (
+    "=" * 50 + "\n"
+    "  🏙️  CITIDLE - Guess the US City!  🏙️\n"
+    + "=" * 50 + "\n"
+    "\n"
+    "Guess the mystery US city (population 300k+).\n"
+    "You have unlimited guesses until you find it!\n"
+    "\n"
+    "After each guess, you'll see how close you are:\n"
+    "  🟢 correct  - You got it!\n"
+    "  🔴 very_hot - Within 50 miles\n"
+    "  🟠 hot      - Within 150 miles\n"
+    "  🟡 warm     - Within 300 miles\n"
+    "  🔵 cool     - Within 600 miles\n"
+    "  ⚪ cold     - Within 1000 miles\n"
+    "  ⬜ very_cold - More than 1000 miles\n"
+    "\n"
+    "Type 'quit' to exit, 'map' to see your guesses.\n"
+    + "-" * 50 + "\n"
+    "\n"
+)
+
+_TIER_EMOJI = {
+    "correct": "🟢",
+    "very_hot": "🔴",
+    "hot": "🟠",
+    "warm": "🟡",
+    "cool": "🔵",
+    "cold": "⚪",
+    "very_cold": "⬜",
+}
+
+
 def print_welcome():
     """Print welcome message and instructions."""
-    print("=" * 50)
-    print("  🏙️  CITIDLE - Guess the US City!  🏙️")
-    print("=" * 50)
-    print()
-    print("Guess the mystery US city (population 300k+).")
-    print("You have unlimited guesses until you find it!")
-    print()
-    print("After each guess, you'll see how close you are:")
-    print("  🟢 correct  - You got it!")
-    print("  🔴 very_hot - Within 50 miles")
-    print("  🟠 hot      - Within 150 miles")
-    print("  🟡 warm     - Within 300 miles")
-    print("  🔵 cool     - Within 600 miles")
-    print("  ⚪ cold     - Within 1000 miles")
-    print("  ⬜ very_cold - More than 1000 miles")
-    print()
-    print("Type 'quit' to exit, 'map' to see your guesses.")
-    print("-" * 50)
-    print()
+    sys.stdout.write(_WELCOME_BANNER)
 
 
 def print_guess_result(result, guess_num: int):
     """Print the result of a guess."""
-    tier_emoji = {
-        "correct": "🟢",
-        "very_hot": "🔴",
-        "hot": "🟠",
-        "warm": "🟡",
-        "cool": "🔵",
-        "cold": "⚪",
-        "very_cold": "⬜",
-    }
-    emoji = tier_emoji.get(result.color_tier, "❓")
+    emoji = _TIER_EMOJI.get(result.color_tier, "❓")
     city_str = f"{result.city.name}, {result.city.state}"
 
     if result.is_correct:
-        print(f"\n{emoji} Guess #{guess_num}: {city_str}")
-        print("🎉 CORRECT! You found it! 🎉")
+        detail = "🎉 CORRECT! You found it! 🎉"
     else:
-        print(f"\n{emoji} Guess #{guess_num}: {city_str}")
-        print(f"   Distance: {result.distance_miles:.0f} miles ({result.color_tier})")
+        detail = f"   Distance: {result.distance_miles:.0f} miles ({result.color_tier})"
+    sys.stdout.write(f"\n{emoji} Guess #{guess_num}: {city_str}\n{detail}\n")
 
 
 def print_map(state: GameState):
@@ -108,12 +113,12 @@ def play_cli():
         if not guess:
             continue
 
-        if guess.lower() == "quit":
+        cmd = guess.lower()
+        if cmd == "quit":
             print(f"\nThe answer was: {state.target.name}, {state.target.state}")
             print("Thanks for playing! See you tomorrow. 👋")
             sys.exit(0)
-
-        if guess.lower() == "map":
+        elif cmd == "map":
             print_map(state)
             continue
 
@@ -140,6 +145,7 @@ def main():
         print(__doc__)
         sys.exit(0)
 
+    warmup()
     play_cli()
 
 
@@ -7,11 +7,14 @@ the same city on the same day, with the daily reset occurring at midnight CST.
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import time
 from datetime import date, datetime, timezone, timedelta
-from typing import List, Optional
+from operator import attrgetter
+from typing import List, Optional, Tuple
 
-from game.distance import CityRecord, build_city_index
+from game.distance import CityRecord, get_city_arrays
 
 # Central Standard Time is UTC-6 (we use CST year-round for consistency,
 # not CDT, to avoid daylight saving complexity)
@@ -20,19 +23,39 @@ CST = timezone(timedelta(hours=-6))
 # Module-level cache for the city list (loaded once)
 _cities_list: Optional[List[CityRecord]] = None
 
+# Last (monotonic_ns, datetime.now(CST)) pair, reused for back-to-back calls
+_now_cache: Optional[Tuple[int, datetime]] = None
+
+
+def _now_cst_cached(ttl_ns: int = 10_000_000) -> datetime:
+    """Return the current CST time, reusing the previous value within `ttl_ns`.
+
+    The CLI banner and each web request ask for "now" several times in a row;
+    a 10 ms window collapses those into one clock read without being visible.
+    """
+    global _now_cache
+    mono = time.monotonic_ns()
+    if _now_cache is not None and mono - _now_cache[0] < ttl_ns:
+        return _now_cache[1]
+    now = datetime.now(CST)
+    _now_cache = (mono, now)
+    return now
+
 
 def _load_cities() -> List[CityRecord]:
     """Load and cache the list of eligible cities from the CSV.
 
-    Returns a flat list of CityRecord objects (one per unique normalized key).
+    Returns a flat list of CityRecord objects (one per unique city and state).
     """
     global _cities_list
     if _cities_list is None:
-        index, _ = build_city_index()
-        # Flatten: take the first record for each normalized key to avoid duplicates
-        _cities_list = [records[0] for records in index.values() if records]
+        # One record per CSV row. Flattening the index instead would repeat each
+        # city once per lookup key ('portland', 'portland or', 'portland oregon', ...)
+        unique = {}
+        for rec in get_city_arrays().records:
+            unique.setdefault(rec.sort_key, rec)
         # Sort by canonical name for deterministic ordering across runs
-        _cities_list.sort(key=lambda c: (c.name.lower(), c.state.lower()))
+        _cities_list = sorted(unique.values(), key=attrgetter("sort_key"))
     return _cities_list
 
 
@@ -49,16 +72,24 @@ def get_daily_city(for_date: Optional[date] = None) -> CityRecord:
     Returns:
         A CityRecord representing the target city for the day.
     """
-    cities = _load_cities()
     if for_date is None:
         # Get current date in CST (Central Standard Time, UTC-6)
-        now_cst = datetime.now(CST)
-        d = now_cst.date()
+        d = _now_cst_cached().date()
     else:
         d = for_date
-    # Use SHA-256 hash of the ISO date string to pick an index
-    hash_hex = hashlib.sha256(d.isoformat().encode("utf-8")).hexdigest()
-    idx = int(hash_hex, 16) % len(cities)
+    return _daily_city_for(d)
+
+
+@functools.lru_cache(maxsize=8)
+def _daily_city_for(d: date) -> CityRecord:
+    """Hash `d` to a city. Memoized so each date is hashed once per process."""
+    cities = _load_cities()
+    # Use an 8-byte BLAKE2b digest of the ISO date string to pick an index.
+    # Not zlib.crc32: CRC is linear, so consecutive dates land on visibly
+    # patterned indexes (roughly "-1 every ten days"); with the per-date cache
+    # the hash runs once a day anyway, so its cost does not matter.
+    digest = hashlib.blake2b(d.isoformat().encode("utf-8"), digest_size=8).digest()
+    idx = int.from_bytes(digest, "big") % len(cities)
     return cities[idx]
 
 
@@ -67,7 +98,7 @@ def get_cst_date() -> date:
     
     Useful for displaying when the next reset occurs.
     """
-    return datetime.now(CST).date()
+    return _now_cst_cached().date()
 
 
 def get_time_until_reset() -> timedelta:
@@ -76,7 +107,7 @@ def get_time_until_reset() -> timedelta:
     Returns:
         A timedelta representing time until midnight CST.
     """
-    now_cst = datetime.now(CST)
+    now_cst = _now_cst_cached()
     # Midnight CST tomorrow
     tomorrow_midnight = datetime.combine(
         now_cst.date() + timedelta(days=1),
@@ -86,6 +117,17 @@ def get_time_until_reset() -> timedelta:
     return tomorrow_midnight - now_cst
 
 
+def warmup() -> None:
+    """Load the city data up front instead of on the first game call.
+
+    Importing the game modules stays cheap; entry points (CLI main, web server
+    startup) call this to pay the index load once before serving. Everything
+    still loads lazily on demand if this is never called.
+    """
+    _load_cities()
+    get_city_arrays()
+
+
 def get_all_cities() -> List[CityRecord]:
     """Return all eligible cities (useful for validation or admin tools)."""
     return list(_load_cities())
@@ -11,15 +11,20 @@ TODO: Implement full game state management (sessions, persistence, etc.)
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 from game.daily import get_daily_city
 from game.distance import (
     CityRecord,
-    build_city_index,
     distance_between_records,
+    distances_from,
     find_cities,
+    get_city_index,
+    shared_row,
 )
 
 # Color tiers based on distance (miles). Closer = darker/warmer color.
@@ -35,15 +40,35 @@ DISTANCE_TIERS: List[Tuple[float, str]] = [
 ]
 
 
+# Parallel views of DISTANCE_TIERS for binary search: a distance belongs to the
+# first tier whose threshold is >= the distance (bisect_left semantics).
+_TIER_THRESHOLDS: List[float] = [threshold for threshold, _ in DISTANCE_TIERS]
+_TIER_NAMES: List[str] = [tier for _, tier in DISTANCE_TIERS]
+_TIER_THRESHOLDS_ARR = np.array(_TIER_THRESHOLDS, dtype=np.float64)
+_TIER_NAMES_ARR = np.array(_TIER_NAMES, dtype=object)
+
+
 def get_color_tier(distance_miles: float) -> str:
     """Return the color tier name for a given distance in miles."""
-    for threshold, tier in DISTANCE_TIERS:
-        if distance_miles <= threshold:
-            return tier
-    return "very_cold"
+    if distance_miles != distance_miles:
+        # NaN (e.g. a "nan" coordinate in the CSV) compares false with every
+        # threshold; bisect would put it in the first tier, so map it to the last
+        return _TIER_NAMES[-1]
+    return _TIER_NAMES[bisect.bisect_left(_TIER_THRESHOLDS, distance_miles)]
+
 
+def get_color_tiers_vectorized(dists: np.ndarray) -> np.ndarray:
+    """Return an array of tier names for an array of distances (miles).
 
-@dataclass
+    Same classification as get_color_tier, done for every element at once
+    (e.g. the output of distance.haversine_to_all).
+    """
+    idx = np.searchsorted(_TIER_THRESHOLDS_ARR, dists, side="left")
+    # searchsorted sorts NaN after inf (one past the end): clamp it to the last tier
+    return _TIER_NAMES_ARR[np.minimum(idx, len(_TIER_NAMES_ARR) - 1)]
+
+
+@dataclass(slots=True)
 class GuessResult:
     """Result of a single guess."""
     city: CityRecord
@@ -52,28 +77,37 @@ class GuessResult:
     is_correct: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Current state of a Citidle game session."""
     target: CityRecord
     guesses: List[GuessResult] = field(default_factory=list)
     is_won: bool = False
+    # distances (miles) from the target to every city, indexed by CityRecord.row
+    target_distances: Optional[np.ndarray] = field(default=None, repr=False)
 
     @property
     def guess_count(self) -> int:
         return len(self.guesses)
 
+    def distance_to_target(self, city: CityRecord) -> float:
+        """Return the distance in miles from `city` to the target.
 
-# Module-level index cache
-_index = None
-_names = None
+        The distances from the target to all cities are computed once per game
+        in a single vectorized pass; each guess is then just an array lookup.
+        Records outside the shared index fall back to the scalar formula.
+        """
+        row = shared_row(city)
+        if row < 0:
+            return distance_between_records(city, self.target)
+        if self.target_distances is None:
+            self.target_distances = distances_from(self.target)
+        return float(self.target_distances[row])
 
 
 def _get_index():
-    global _index, _names
-    if _index is None:
-        _index, _names = build_city_index()
-    return _index, _names
+    # Shared with game.daily, so guessed records and the target are the same objects
+    return get_city_index()
 
 
 def start_game() -> GameState:
@@ -107,12 +141,11 @@ def submit_guess(state: GameState, guess_text: str) -> Optional[GuessResult]:
 
     # Take the first match (user can disambiguate with state if needed)
     guessed_city = matches[0]
-    dist = distance_between_records(guessed_city, state.target)
+    dist = state.distance_to_target(guessed_city)
     tier = get_color_tier(dist)
-    is_correct = dist == 0 or (
-        guessed_city.name.lower() == state.target.name.lower()
-        and guessed_city.state.lower() == state.target.state.lower()
-    )
+    # Guesses come from the shared index, so identity is the fast path; a target
+    # built elsewhere (e.g. a copy) is matched by name/state instead
+    is_correct = guessed_city is state.target or guessed_city.sort_key == state.target.sort_key
 
     result = GuessResult(
         city=guessed_city,
@@ -12,6 +12,10 @@ from __future__ import annotations
 
 from typing import Dict, List, Tuple
 
+# game.engine must never import map.renderer (see tests/test_renderer.py),
+# otherwise this module-level import becomes circular.
+from game.engine import get_color_tier as _get_color_tier
+
 # Color palette for proximity tiers (hex colors for rendering)
 # Warmer = closer, Cooler = farther
 TIER_COLORS: Dict[str, str] = {
@@ -24,6 +28,9 @@ TIER_COLORS: Dict[str, str] = {
     "very_cold": "#E0E0E0",  # light gray - very far
 }
 
+# Bound format method for one line of render_map_stub output
+_MAP_ROW = "  • {city}, {state}: {dist:.0f} mi ({tier}, {color})".format
+
 
 def get_color_for_tier(tier: str) -> str:
     """Return the hex color for a given proximity tier.
@@ -42,9 +49,7 @@ def get_color_for_distance(distance_miles: float) -> str:
 
     This is a convenience function that maps distance -> tier -> color.
     """
-    from game.engine import get_color_tier
-    tier = get_color_tier(distance_miles)
-    return get_color_for_tier(tier)
+    return get_color_for_tier(_get_color_tier(distance_miles))
 
 
 def render_map_stub(
@@ -63,11 +68,10 @@ def render_map_stub(
     if not guesses:
         return "[Empty US Map - no guesses yet]"
 
-    lines = ["[US Map with guesses:]"]
-    for city, state, dist, tier in guesses:
-        color = get_color_for_tier(tier)
-        lines.append(f"  • {city}, {state}: {dist:.0f} mi ({tier}, {color})")
-    return "\n".join(lines)
+    return "[US Map with guesses:]\n" + "\n".join(
+        _MAP_ROW(city=city, state=state, dist=dist, tier=tier, color=TIER_COLORS.get(tier, "#E0E0E0"))
+        for city, state, dist, tier in guesses
+    )
 
 
 def get_us_map_bounds() -> Dict[str, float]:
@@ -108,3 +108,54 @@ def test_daily_city_uses_cst_date():
     city_for_cst = daily.get_daily_city(cst_date)
     assert city_default.name == city_for_cst.name
     assert city_default.state == city_for_cst.state
+
+
+def test_daily_city_is_memoized_per_date():
+    """Repeated lookups for the same date should hit the per-date cache."""
+    test_date = date(2026, 3, 14)
+    daily.get_daily_city(test_date)
+    hits_before = daily._daily_city_for.cache_info().hits
+    daily.get_daily_city(test_date)
+    assert daily._daily_city_for.cache_info().hits == hits_before + 1
+
+
+def test_now_cst_cached_reuses_value_within_ttl():
+    """Back-to-back calls inside the TTL should return the same datetime."""
+    first = daily._now_cst_cached(ttl_ns=60_000_000_000)
+    second = daily._now_cst_cached(ttl_ns=60_000_000_000)
+    assert first is second
+    assert first.utcoffset() == timedelta(hours=-6)
+
+
+def test_daily_city_is_same_object_as_index_lookup():
+    """The target and a lookup of its name should be the identical CityRecord.
+
+    engine.submit_guess relies on this to detect a correct guess by identity.
+    """
+    from game.distance import find_cities, get_city_index
+
+    target = daily.get_daily_city(date(2026, 2, 1))
+    index, names = get_city_index()
+    matches, _ = find_cities(f"{target.name}, {target.state}", index, names)
+    assert matches[0] is target
+    again, _ = find_cities(f"{target.name}, {target.state}", index, names)
+    assert again[0] is matches[0]
+
+
+def test_warmup_loads_city_list():
+    """warmup should leave the city list cached for later calls."""
+    daily.warmup()
+    assert daily._cities_list is not None
+    assert daily.get_all_cities() == daily._cities_list
+
+
+def test_get_all_cities_has_no_duplicates():
+    """Each city should appear once, matching the rows of data/cities.csv."""
+    from game.distance import DEFAULT_CITIES_CSV
+
+    cities = daily.get_all_cities()
+    keys = [(c.name, c.state) for c in cities]
+    assert len(keys) == len(set(keys))
+    with open(DEFAULT_CITIES_CSV, encoding="utf-8") as fh:
+        rows = [line for line in fh.read().splitlines()[1:] if line.strip()]
+    assert len(cities) == len(rows)
@@ -97,3 +97,191 @@ def test_all_canonical_alias_targets_exist_in_index():
             missing.append(target)
     assert not missing, f"Canonical alias targets missing from index: {missing}"
 
+
+
+def test_haversine_to_all_matches_scalar_distance():
+    idx, names = dist.build_city_index()
+    nyc = dist.find_cities("NYC", idx, names)[0][0]
+    dists = dist.distances_from(nyc)
+    records = dist.get_city_arrays().records
+    assert len(dists) == len(records)
+    assert dists[nyc.row] == 0
+    for rec in records:
+        assert math.isclose(dists[rec.row], dist.distance_between_records(nyc, rec), abs_tol=1e-6)
+
+
+def test_closest_cities_sorted_and_excludes_self():
+    idx, names = dist.build_city_index()
+    la = dist.find_cities("LA", idx, names)[0][0]
+    closest = dist.closest_cities(la, 5)
+    assert len(closest) == 5
+    assert all(rec.row != la.row for rec, _ in closest)
+    miles = [m for _, m in closest]
+    assert miles == sorted(miles)
+
+
+def test_off_index_records_are_not_looked_up_by_row():
+    import dataclasses
+
+    idx, names = dist.build_city_index()
+    la = dist.find_cities("LA", idx, names)[0][0]
+    assert dist.shared_row(la) == la.row
+    copy = dataclasses.replace(la)
+    hand_built = dist.CityRecord("Los Angeles", "CA", la.lat, la.lng, la.population)
+    for rec in (copy, hand_built):
+        assert dist.shared_row(rec) == -1
+        closest = dist.closest_cities(rec, 5)
+        assert len(closest) == 5
+        assert all(other.sort_key != la.sort_key for other, _ in closest)
+        assert closest == dist.closest_cities(la, 5)
+
+
+def test_city_record_equality_ignores_row():
+    idx, names = dist.build_city_index()
+    la = dist.find_cities("LA", idx, names)[0][0]
+    hand_built = dist.CityRecord(la.name, la.state, la.lat, la.lng, la.population)
+    assert hand_built.row == -1
+    assert hand_built == la
+    assert hash(hand_built) == hash(la)
+
+
+def test_fast_record_distance_matches_haversine():
+    idx, names = dist.build_city_index()
+    a = dist.find_cities("Seattle", idx, names)[0][0]
+    b = dist.find_cities("Miami", idx, names)[0][0]
+    expected = dist.haversine_distance(a.lat, a.lng, b.lat, b.lng)
+    assert math.isclose(dist.distance_between_records_fast(a, b), expected, rel_tol=1e-9)
+    assert dist.distance_between_records_fast(a, a) == 0
+
+
+def test_city_record_uses_slots():
+    idx, names = dist.build_city_index()
+    rec = dist.find_cities("Denver", idx, names)[0][0]
+    assert not hasattr(rec, "__dict__")
+
+
+def test_city_record_is_immutable():
+    idx, names = dist.build_city_index()
+    rec = dist.find_cities("Denver", idx, names)[0][0]
+    with pytest.raises(AttributeError):
+        rec.lat = 0.0
+
+
+def test_build_city_index_uses_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("CITIDLE_NO_CACHE", raising=False)
+    csv_copy = tmp_path / "cities.csv"
+    csv_copy.write_bytes(open(dist.DEFAULT_CITIES_CSV, "rb").read())
+    cache_file = tmp_path / ("cities.csv" + dist.INDEX_CACHE_SUFFIX)
+
+    idx1, names1 = dist.build_city_index(str(csv_copy))
+    assert cache_file.exists()
+
+    # the second build must come from the cache, not from parsing the CSV
+    def no_parse(*args, **kwargs):
+        raise AssertionError("CSV was parsed despite a valid cache")
+
+    dist._load_city_index_for.cache_clear()  # force a reload from disk
+    with monkeypatch.context() as m:
+        m.setattr(dist.csv, "reader", no_parse)
+        idx2, names2 = dist.build_city_index(str(csv_copy))
+    assert names1 == names2
+    assert idx1.keys() == idx2.keys()
+
+    # a changed CSV invalidates the cache
+    with open(csv_copy, "a", encoding="utf-8") as fh:
+        fh.write("Testville,ZZ,40.0,-100.0,300000\n")
+    idx3, _ = dist.build_city_index(str(csv_copy))
+    assert "testville" in idx3
+
+
+def test_disk_cache_is_invalidated_by_alias_changes(tmp_path, monkeypatch):
+    monkeypatch.delenv("CITIDLE_NO_CACHE", raising=False)
+    csv_copy = tmp_path / "cities.csv"
+    csv_copy.write_bytes(open(dist.DEFAULT_CITIES_CSV, "rb").read())
+    dist.build_city_index(str(csv_copy))
+
+    # same CSV and version, but different normalization tables: must re-parse
+    parsed = []
+    real_reader = dist.csv.reader
+
+    def tracking_reader(*args, **kwargs):
+        parsed.append(True)
+        return real_reader(*args, **kwargs)
+
+    dist._load_city_index_for.cache_clear()
+    dist._index_fingerprint.cache_clear()
+    try:
+        with monkeypatch.context() as m:
+            m.setattr(dist, "CANONICAL_ALIASES", {**dist.CANONICAL_ALIASES, "testalias": "chicago"})
+            m.setattr(dist.csv, "reader", tracking_reader)
+            dist.build_city_index(str(csv_copy))
+    finally:
+        dist._load_city_index_for.cache_clear()
+        dist._index_fingerprint.cache_clear()
+    assert parsed
+
+
+def test_build_city_index_cache_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("CITIDLE_NO_CACHE", "1")
+    csv_copy = tmp_path / "cities.csv"
+    csv_copy.write_bytes(open(dist.DEFAULT_CITIES_CSV, "rb").read())
+    dist.build_city_index(str(csv_copy))
+    assert not (tmp_path / ("cities.csv" + dist.INDEX_CACHE_SUFFIX)).exists()
+
+
+def test_normalize_punctuation_ascii_and_unicode():
+    # ASCII punctuation uses the translate table, other input falls back to the regex
+    assert dist.normalize_name("Winston-Salem!") == "winston salem"
+    assert dist.normalize_name("Coeur d’Alene") == "coeur d alene"
+
+
+def test_ascii_punct_table_matches_regex():
+    # the translate fast path must treat every ASCII character like _punct_re,
+    # including control characters that are not in string.punctuation
+    for i in range(128):
+        c = chr(i)
+        assert c.translate(dist._PUNCT_TRANS) == dist._punct_re.sub(" ", c), repr(c)
+    assert dist.normalize_name("\x00nyc") == "new york"
+
+
+def test_normalize_name_is_memoized():
+    dist.normalize_name("Albuquerque, NM")
+    hits_before = dist.normalize_name.cache_info().hits
+    assert dist.normalize_name("Albuquerque, NM") == "albuquerque nm"
+    assert dist.normalize_name.cache_info().hits == hits_before + 1
+
+
+def test_build_city_index_missing_column_raises(tmp_path):
+    bad = tmp_path / "cities.csv"
+    bad.write_text("name,state,lat,lng\nTestville,ZZ,40.0,-100.0\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        dist.build_city_index(str(bad))
+
+
+def test_state_strings_are_shared_between_records():
+    idx, names = dist.build_city_index()
+    texas = [r for recs in idx.values() for r in recs if r.state == "TX"]
+    assert len(texas) > 1
+    assert all(r.state is texas[0].state for r in texas)
+
+
+def test_build_city_index_is_memoized_and_frozen():
+    idx1, names1 = dist.build_city_index()
+    idx2, names2 = dist.build_city_index()
+    assert idx1 is idx2
+    assert isinstance(names1, tuple)
+    # a plain dict: lookups of unknown keys must not insert entries
+    assert not isinstance(idx1, dist.defaultdict)
+
+
+def test_canonical_aliases_is_read_only():
+    with pytest.raises(TypeError):
+        dist.CANONICAL_ALIASES["test"] = "value"
+
+
+def test_state_disambiguation_full_state_name():
+    idx, names = dist.build_city_index()
+    matches, _ = dist.find_cities("Portland, Oregon", idx, names)
+    assert matches and matches[0].state == "OR"
+    matches, _ = dist.find_cities("Kansas City Missouri", idx, names)
+    assert matches and matches[0].state == "MO"
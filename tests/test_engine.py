@@ -94,3 +94,52 @@ def test_guess_result_contains_distance():
     if result:  # NYC might be the target, but should still have distance
         assert hasattr(result, "distance_miles")
         assert isinstance(result.distance_miles, float)
+
+
+def test_distance_to_target_for_off_index_record():
+    """A copy of a record (not from the shared index) must not be looked up by row."""
+    import dataclasses
+
+    from game.distance import distance_between_records
+
+    state = engine.start_game()
+    copy = dataclasses.replace(state.target)
+    assert state.distance_to_target(copy) == 0.0
+    moved = dataclasses.replace(state.target, lat=state.target.lat + 1.0, row=0)
+    expected = distance_between_records(moved, state.target)
+    assert state.distance_to_target(moved) == expected
+
+
+def test_submit_guess_wins_with_copied_target():
+    """A target that is not the shared index record can still be guessed."""
+    import dataclasses
+
+    target = dataclasses.replace(get_daily_city())
+    state = engine.GameState(target=target)
+    result = engine.submit_guess(state, f"{target.name}, {target.state}")
+
+    assert result.is_correct is True
+    assert result.distance_miles == 0.0
+    assert state.is_won is True
+
+
+def test_get_color_tiers_vectorized_matches_scalar():
+    """The vectorized classifier should agree with get_color_tier element-wise."""
+    import numpy as np
+
+    dists = np.array([0, 25, 50, 100, 150, 200, 300, 500, 600, 800, 1000, 1500, np.inf, np.nan])
+    tiers = engine.get_color_tiers_vectorized(dists)
+    assert list(tiers) == [engine.get_color_tier(d) for d in dists]
+    assert engine.get_color_tier(float("nan")) == "very_cold"
+
+
+def test_color_tier_thresholds_are_inclusive():
+    """A distance exactly on a threshold belongs to the closer tier."""
+    import numpy as np
+
+    thresholds = [t for t, _ in engine.DISTANCE_TIERS[:-1]]
+    expected = [tier for _, tier in engine.DISTANCE_TIERS[:-1]]
+    assert [engine.get_color_tier(t) for t in thresholds] == expected
+    assert list(engine.get_color_tiers_vectorized(np.array(thresholds, dtype=float))) == expected
+    # just past a threshold moves to the next tier
+    assert engine.get_color_tier(50.01) == "hot"
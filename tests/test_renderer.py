@@ -0,0 +1,46 @@
+"""Tests for map/renderer.py - color utilities and map stub."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from map import renderer
+
+
+def test_get_color_for_distance_maps_through_tiers():
+    """Distances should map to the color of their proximity tier."""
+    assert renderer.get_color_for_distance(0) == renderer.TIER_COLORS["correct"]
+    assert renderer.get_color_for_distance(25) == renderer.TIER_COLORS["very_hot"]
+    assert renderer.get_color_for_distance(5000) == renderer.TIER_COLORS["very_cold"]
+
+
+def test_get_color_for_unknown_tier_defaults_to_gray():
+    """Unknown tiers should fall back to the light gray color."""
+    assert renderer.get_color_for_tier("nope") == "#E0E0E0"
+
+
+def test_engine_does_not_import_renderer():
+    """game.engine must not pull in map.renderer (renderer imports engine at load)."""
+    # a fresh interpreter rooted at the repo, so this passes from any working
+    # directory and an import error is reported as such, not as a cycle
+    repo_root = Path(__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(repo_root), os.environ.get("PYTHONPATH")]))}
+    code = "import sys, game.engine; print('map.renderer' in sys.modules)"
+    proc = subprocess.run([sys.executable, "-c", code], cwd=repo_root, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, f"importing game.engine failed:\n{proc.stderr}"
+    assert proc.stdout.strip() == "False", "game.engine imported map.renderer"
+
+
+def test_render_map_stub_lists_each_guess():
+    """Each guess should appear on its own line with distance, tier and color."""
+    out = renderer.render_map_stub([
+        ("Chicago", "IL", 812.4, "cold"),
+        ("Denver", "CO", 12.0, "very_hot"),
+    ])
+    assert out.splitlines() == [
+        "[US Map with guesses:]",
+        "  • Chicago, IL: 812 mi (cold, #87CEEB)",
+        "  • Denver, CO: 12 mi (very_hot, #FF0000)",
+    ]
+    assert renderer.render_map_stub([]) == "[Empty US Map - no guesses yet]"
@@ -40,6 +40,11 @@ class TestGameInfo:
         assert isinstance(data["total_cities"], int)
         assert data["total_cities"] > 0
 
+    def test_game_info_short_cache_lifetime(self, client):
+        """The countdown may only be cached for a second."""
+        response = client.get("/api/game/info")
+        assert response.headers["Cache-Control"] == "max-age=1, must-revalidate"
+
     def test_game_info_time_format(self, client):
         """time_until_reset should have hours, minutes, seconds."""
         response = client.get("/api/game/info")
@@ -57,6 +62,22 @@ class TestGameInfo:
         assert time_data["seconds"] >= 0
 
 
+class TestTargetHash:
+    """Tests for /api/game/target-hash endpoint."""
+
+    def test_target_hash_is_stable_blake2b(self, client):
+        """The hash should be a process-independent BLAKE2b of 'name,state'."""
+        import hashlib
+
+        target = get_daily_city()
+        key = f"{target.name},{target.state}".lower().encode("utf-8")
+        expected = int.from_bytes(hashlib.blake2b(key, digest_size=4).digest(), "big")
+
+        response = client.get("/api/game/target-hash")
+        data = json.loads(response.data)
+        assert data["target_hash"] == expected
+
+
 class TestGuessEndpoint:
     """Tests for /api/guess endpoint."""
 
@@ -80,6 +101,34 @@ class TestGuessEndpoint:
         )
         assert response.status_code == 400
 
+    @pytest.mark.parametrize("body", [b"{not json", b"[1, 2]", b'{"guess": 42}'])
+    def test_guess_malformed_body_returns_400(self, client, body):
+        """Malformed JSON, non-object bodies and non-string guesses get a JSON 400."""
+        response = client.post("/api/guess", data=body, content_type="application/json")
+        assert response.status_code == 400
+        assert json.loads(response.data)["success"] is False
+
+    def test_guess_too_long_returns_400(self, client):
+        """Guesses over MAX_GUESS_LENGTH are rejected before any lookup."""
+        from web import MAX_GUESS_LENGTH
+
+        response = client.post(
+            "/api/guess",
+            data=json.dumps({"guess": "x" * (MAX_GUESS_LENGTH + 1)}),
+            content_type="application/json"
+        )
+        assert response.status_code == 400
+        assert json.loads(response.data)["success"] is False
+
+    def test_oversized_body_returns_413(self, client):
+        """Bodies over MAX_CONTENT_LENGTH are refused outright."""
+        response = client.post(
+            "/api/guess",
+            data=json.dumps({"guess": "x" * (app.config["MAX_CONTENT_LENGTH"] + 1)}),
+            content_type="application/json"
+        )
+        assert response.status_code == 413
+
     def test_guess_empty_string_returns_error(self, client):
         """Empty guess string should return error."""
         response = client.post(
@@ -165,6 +214,69 @@ class TestGuessEndpoint:
         assert data["result"]["city"]["state"].upper() in ["OR", "OREGON"]
 
 
+class TestGuessBatchEndpoint:
+    """Tests for /api/guess/batch endpoint."""
+
+    def _post(self, client, body):
+        return client.post(
+            "/api/guess/batch",
+            data=json.dumps(body),
+            content_type="application/json"
+        )
+
+    def test_batch_requires_guesses_list(self, client):
+        """A body without a 'guesses' list should return 400."""
+        assert self._post(client, {"guess": "Chicago"}).status_code == 400
+        assert self._post(client, {"guesses": "Chicago"}).status_code == 400
+
+    def test_batch_rejects_oversized_batches(self, client):
+        """More than MAX_BATCH_GUESSES guesses should return 400."""
+        from web import MAX_BATCH_GUESSES
+
+        response = self._post(client, {"guesses": ["Chicago"] * (MAX_BATCH_GUESSES + 1)})
+        assert response.status_code == 400
+
+    def test_batch_reports_too_long_entries(self, client):
+        """Over-long entries fail individually without affecting the others."""
+        from web import MAX_GUESS_LENGTH
+
+        response = self._post(client, {"guesses": ["x" * (MAX_GUESS_LENGTH + 1), "Chicago"]})
+        results = json.loads(response.data)["results"]
+        assert results[0]["success"] is False
+        assert len(results[0]["guess"]) == MAX_GUESS_LENGTH
+        assert results[1]["success"] is True
+
+    def test_batch_reports_non_string_entries_as_invalid(self, client):
+        """Non-string entries are invalid guesses, not empty ones."""
+        from web import _GUESS_NOT_STRING
+
+        response = self._post(client, {"guesses": [1, None, {}, "  "]})
+        results = json.loads(response.data)["results"]
+        assert [r["error"] for r in results[:3]] == [_GUESS_NOT_STRING] * 3
+        assert all(r["guess"] is None for r in results[:3])
+        assert results[3]["error"] == "Empty guess"
+
+    def test_batch_matches_single_guess_results(self, client):
+        """Each batch entry should equal the /api/guess response for that guess."""
+        guesses = ["Chicago", "NotARealCity12345", "Portland, OR", "  ", get_daily_city().name]
+        response = self._post(client, {"guesses": guesses})
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["success"] is True
+        assert len(data["results"]) == len(guesses)
+
+        for guess, entry in zip(guesses, data["results"]):
+            if not guess.strip():
+                assert entry["success"] is False
+                continue
+            single = json.loads(client.post(
+                "/api/guess",
+                data=json.dumps({"guess": guess}),
+                content_type="application/json"
+            ).data)
+            assert entry == single
+
+
 class TestRevealEndpoint:
     """Tests for /api/reveal endpoint."""
 
@@ -215,6 +327,17 @@ class TestCitiesEndpoint:
         assert isinstance(data["cities"], list)
         assert len(data["cities"]) > 0
 
+    def test_cities_sends_etag_and_honors_if_none_match(self, client):
+        """A repeat request with the ETag should get 304 Not Modified."""
+        response = client.get("/api/cities")
+        etag = response.headers.get("ETag")
+        assert etag
+        assert "max-age=86400" in response.headers["Cache-Control"]
+
+        repeat = client.get("/api/cities", headers={"If-None-Match": etag})
+        assert repeat.status_code == 304
+        assert repeat.data == b""
+
     def test_cities_format(self, client):
         """Each city should be in 'Name, State' format."""
         response = client.get("/api/cities")
@@ -226,6 +349,78 @@ class TestCitiesEndpoint:
             assert len(parts) == 2
 
 
+class TestClosestEndpoint:
+    """Tests for /api/closest endpoint."""
+
+    def test_closest_requires_city(self, client):
+        """GET without a city should return 400."""
+        response = client.get("/api/closest")
+        assert response.status_code == 400
+
+    def test_closest_rejects_non_integer_n(self, client):
+        """A non-numeric n should return 400."""
+        response = client.get("/api/closest?city=Chicago&n=abc")
+        assert response.status_code == 400
+
+    def test_closest_rejects_too_long_city(self, client):
+        """A city query over MAX_GUESS_LENGTH should return 400."""
+        from web import MAX_GUESS_LENGTH
+
+        response = client.get("/api/closest", query_string={"city": "x" * (MAX_GUESS_LENGTH + 1)})
+        assert response.status_code == 400
+
+    def test_closest_unknown_city_returns_error(self, client):
+        """Unknown city should return success=False."""
+        response = client.get("/api/closest?city=NotARealCity12345")
+        data = json.loads(response.data)
+        assert data["success"] is False
+
+    def test_closest_returns_sorted_neighbors(self, client):
+        """Should return n neighbors, nearest first, excluding the city itself."""
+        response = client.get("/api/closest?city=Dallas&n=3")
+        data = json.loads(response.data)
+
+        assert data["success"] is True
+        assert data["city"]["name"] == "Dallas"
+        closest = data["closest"]
+        assert len(closest) == 3
+        assert all(c["city"]["name"] != "Dallas" for c in closest)
+        miles = [c["distance_miles"] for c in closest]
+        assert miles == sorted(miles)
+        # the other Metroplex cities are the nearest 300k+ cities to Dallas
+        assert {"Arlington", "Fort Worth"} <= {c["city"]["name"] for c in closest}
+
+
+class TestJSONProvider:
+    """Tests for the orjson-backed JSON provider."""
+
+    def test_output_is_compact_and_unsorted_by_default(self):
+        """Default output keeps insertion order and has no whitespace."""
+        assert app.json.dumps({"b": 1, "a": [1, 2]}) == '{"b":1,"a":[1,2]}'
+
+    def test_sort_keys_switch(self):
+        """Setting sort_keys should sort object keys like Flask's default provider."""
+        app.json.sort_keys = True
+        try:
+            assert app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+        finally:
+            app.json.sort_keys = False
+
+    def test_dumps_passes_default_through(self):
+        """A caller's default= hook should be used for unsupported types."""
+        assert app.json.dumps({"s": {3}}, default=sorted) == '{"s":[3]}'
+
+    def test_response_argument_forms(self):
+        """response() should accept the same argument forms as jsonify()."""
+        with app.app_context():
+            assert json.loads(app.json.response({"a": 1}).data) == {"a": 1}
+            assert json.loads(app.json.response(1, 2).data) == [1, 2]
+            assert json.loads(app.json.response(a=1).data) == {"a": 1}
+            assert app.json.response().data == b"null"
+            with pytest.raises(TypeError):
+                app.json.response(1, a=2)
+
+
 class TestIndexPage:
     """Tests for serving the main page."""
 
@@ -239,6 +434,17 @@ class TestIndexPage:
         response = client.get("/")
         assert b"<!DOCTYPE html>" in response.data or b"<html" in response.data
 
+    def test_index_sends_etag_and_honors_if_none_match(self, client):
+        """The page should be revalidated and answered with 304 when unchanged."""
+        response = client.get("/")
+        etag = response.headers.get("ETag")
+        assert etag
+        assert response.headers["Cache-Control"] == "no-cache"
+
+        repeat = client.get("/", headers={"If-None-Match": etag})
+        assert repeat.status_code == 304
+        assert repeat.data == b""
+
 
 class TestHelperFunctions:
     """Tests for helper functions."""
@@ -265,3 +471,82 @@ class TestHelperFunctions:
         assert isinstance(result["lat"], (int, float))
         assert isinstance(result["lng"], (int, float))
         assert isinstance(result["population"], int)
+
+    def test_find_cached_reuses_normalized_lookups(self):
+        """Queries that normalize to the same key should share one cache entry."""
+        from web import _find, _find_cached
+
+        _find_cached.cache_clear()
+        first = _find("Los Angeles")
+        second = _find("  los   ANGELES ")
+
+        assert first and first[0].name == "Los Angeles"
+        assert second is first
+        info = _find_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_round_miles_matches_vector_rounding(self):
+        """Scalar and array rounding should agree, including .x5 halfway values."""
+        import numpy as np
+        from web import _round_miles, _round_miles_array
+
+        values = [0.0, 0.04, 0.05, 12.25, 12.35, 49.95, 999.99, 2789.456]
+        assert [_round_miles(v) for v in values] == _round_miles_array(np.array(values))
+        assert _round_miles(49.95) == 50.0
+        assert _round_miles(2789.456) == 2789.5
+
+    def test_city_to_dict_is_precomputed_for_shared_records(self):
+        """Shared-index records should map to one prebuilt dict; others still convert."""
+        import dataclasses
+
+        city = get_daily_city()
+        assert _city_to_dict(city) is _city_to_dict(city)
+
+        copy = dataclasses.replace(city)
+        result = _city_to_dict(copy)
+        assert result == _city_to_dict(city)
+        assert result is not _city_to_dict(city)
+
+    def test_web_index_uses_shared_records(self):
+        """Lookups must return the shared records that rows and _CITY_DICTS refer to."""
+        import web
+        from game.distance import shared_row
+
+        for matches in web._index.values():
+            for city in matches:
+                assert shared_row(city) == city.row
+                assert id(city) in web._CITY_DICTS
+
+    def test_daily_target_is_prepared_once_per_day(self, monkeypatch):
+        """_daily_target should reuse today's entry and replace it on a new day."""
+        from datetime import timedelta
+
+        import web
+        from game.distance import distance_between_records
+
+        today = get_cst_date()
+        first = web._daily_target()
+        assert web._daily_target() is first
+        assert first.record is get_daily_city()
+        assert first.city_dict is _city_to_dict(first.record)
+        assert first.distances[first.record.row] == 0.0
+        some_city = web.get_city_arrays().records[0]
+        expected = distance_between_records(some_city, first.record)
+        assert float(first.distances[some_city.row]) == pytest.approx(expected)
+
+        tomorrow = today + timedelta(days=1)
+        monkeypatch.setattr(web, "get_cst_date", lambda: tomorrow)
+        nxt = web._daily_target()
+        assert nxt.record is get_daily_city(tomorrow)
+        assert list(web._TARGET_CACHE) == [tomorrow]
+
+    def test_find_does_not_memoize_misses(self):
+        """Unknown queries must not take up entries in the lookup cache."""
+        from web import _find, _find_cached
+
+        _find_cached.cache_clear()
+        assert _find("NotARealCity12345") == []
+        assert _find_cached.cache_info().currsize == 0
+        assert _find("Chicago")
+        assert _find_cached.cache_info().currsize == 1
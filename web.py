@@ -3,38 +3,209 @@
 Provides REST API endpoints and serves the web UI.
 
 Run with:
-    python web.py
-    # or
-    flask --app web run --debug
+    python web.py                  # http://localhost:5001, no reloader
+    CITIDLE_DEV=1 python web.py    # same, with Flask debug + reloader
+    # or, production-style (what the Procfile runs):
+    gunicorn --workers 4 --preload -b 127.0.0.1:5001 web:app
 
-Then open http://localhost:5000 in your browser.
+All city data is loaded at import time, so with --preload it is built once in
+the gunicorn master and shared copy-on-write by the forked workers.
 """
 
 from __future__ import annotations
 
-import os
 import json
+import functools
+import os
+import hashlib
 from datetime import date
-from flask import Flask, jsonify, request, send_from_directory
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+import numpy as np
+import orjson
+from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
-from game.daily import get_daily_city, get_all_cities, get_time_until_reset, get_cst_date
-from game.distance import find_cities, build_city_index, distance_between_records
-from game.engine import get_color_tier
+from game.daily import get_daily_city, get_all_cities, get_time_until_reset, get_cst_date, warmup
+from game.distance import (
+    CityRecord,
+    closest_cities,
+    distances_from,
+    find_cities_normalized,
+    get_city_arrays,
+    get_city_index,
+    normalize_name,
+)
+from game.engine import get_color_tier, get_color_tiers_vectorized
 
 # Get absolute path to static folder
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-STATIC_DIR = os.path.join(BASE_DIR, "static")
+BASE_DIR = Path(__file__).resolve().parent
+STATIC_DIR = BASE_DIR / "static"
+
+# The game page is a single static file; read it once instead of per request
+_INDEX_HTML = (STATIC_DIR / "index.html").read_bytes()
+# Validator for the page, so browsers revalidate with If-None-Match and get a 304
+_INDEX_ETAG = hashlib.blake2b(_INDEX_HTML, digest_size=16).hexdigest()
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (faster encode/decode than stdlib json).
+
+    numpy scalars/arrays (e.g. vectorized distances) serialize without conversion.
+    Honors the same ``sort_keys`` / ``compact`` switches as Flask's default
+    provider, but defaults to unsorted, compact output (no per-response key
+    sort, no whitespace).
+    """
+
+    sort_keys: bool = False
+    compact: bool = True
+
+    def _option(self) -> int:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if not self.compact:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize `obj`; a ``default`` callable is passed to orjson.
+
+        Other json.dumps keyword arguments (indent, separators, ...) have no
+        orjson equivalent and are ignored; use the provider switches instead.
+        """
+        return orjson.dumps(obj, default=kwargs.get("default"), option=self._option()).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        """Deserialize `s`; json.loads keyword arguments are ignored (orjson takes none)."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # same argument handling as jsonify() (not via the private
+        # JSONProvider._prepare_response_obj), but without the
+        # bytes -> str -> bytes round trip of the base implementation
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        return self._app.response_class(orjson.dumps(obj, option=self._option()), mimetype="application/json")
+
 
 app = Flask(__name__, static_folder=STATIC_DIR, static_url_path="/static")
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for development
 
-# Cache the city index at startup
-_index, _names = build_city_index()
+# Upper bound on guesses accepted by /api/guess/batch in one request
+MAX_BATCH_GUESSES = 100
+# Longest accepted guess / city query (the longest city name is far shorter);
+# checked before normalization so oversized input never reaches a cache
+MAX_GUESS_LENGTH = 100
+_GUESS_TOO_LONG = f"Guess must be at most {MAX_GUESS_LENGTH} characters"
+_GUESS_NOT_STRING = "Guess must be a string"
+_CITY_NOT_FOUND = "City not found. Make sure it's a US city with 300k+ population."
+# Request bodies are small JSON objects; a full batch of maximum-length guesses
+# (even with every character \u-escaped) fits comfortably in 64 KiB
+app.config["MAX_CONTENT_LENGTH"] = 64 * 1024
 
+# Load all city data at startup (before gunicorn forks its workers)
+warmup()
+# The shared index (as in game.engine): its records are the get_city_arrays()
+# records, which the row lookups and _CITY_DICTS below rely on
+_index, _names = get_city_index()
 
-def _city_to_dict(city) -> dict:
-    """Convert a CityRecord to a JSON-serializable dict."""
+# The city list never changes at runtime: count it and serialize /api/cities once
+_TOTAL_CITIES = len(get_all_cities())
+_CITIES_JSON = orjson.dumps({"cities": [f"{c.name}, {c.state}" for c in get_all_cities()]})
+# Strong validator for /api/cities: changes only when the payload does (i.e. on redeploy)
+_CITIES_ETAG = hashlib.blake2b(_CITIES_JSON, digest_size=16).hexdigest()
+
+
+class _DailyTarget(NamedTuple):
+    """Everything the guess endpoints need about one day's target."""
+    record: CityRecord
+    city_dict: dict
+    distances: np.ndarray  # miles from the target to every city, by CityRecord.row
+    name_lower: str
+    state_lower: str
+
+
+# Today's _DailyTarget, keyed by CST date; only the current day is kept
+_TARGET_CACHE: Dict[date, _DailyTarget] = {}
+
+
+def _prepare_target(day: date) -> _DailyTarget:
+    target = get_daily_city(day)
+    distances = distances_from(target)
+    distances.flags.writeable = False  # shared by every request for the day
+    return _DailyTarget(target, _city_to_dict(target), distances, target.name_lower, target.state_lower)
+
+
+def _daily_target() -> _DailyTarget:
+    """Return today's target with its derived values, computed once per CST day."""
+    day = get_cst_date()
+    tgt = _TARGET_CACHE.get(day)
+    if tgt is None:
+        tgt = _prepare_target(day)
+        _TARGET_CACHE.clear()
+        _TARGET_CACHE[day] = tgt
+    return tgt
+
+
+def _body() -> Optional[dict]:
+    """Parse the JSON object request body with orjson, or return None.
+
+    Replaces request.get_json(): orjson decodes the raw bytes directly and a
+    malformed body, a non-JSON content type or a non-object payload all come
+    back as None, so handlers answer with their own 400 instead of Flask's
+    error page.
+    """
+    if not request.is_json:
+        return None
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _round_miles(miles: float) -> float:
+    """Round a (non-negative) distance to 0.1 mile, half up.
+
+    Same arithmetic as _round_miles_array, so /api/guess and /api/guess/batch
+    always agree on the reported distance.
+    """
+    return int(miles * 10.0 + 0.5) / 10.0
+
+
+def _round_miles_array(miles: np.ndarray) -> list:
+    """Vectorized _round_miles, converted to Python floats in one tolist() call."""
+    return (np.floor(miles * 10.0 + 0.5) / 10.0).tolist()
+
+
+@functools.lru_cache(maxsize=4096)
+def _find_cached(qnorm: str):
+    """Matches for a normalized query; the index is immutable, so results never go stale.
+
+    Only called for keys of the index (see _find), so its contents are bounded
+    by the index and never by client input. Call _find_cached.cache_clear() if
+    the index is ever reloaded.
+    """
+    return find_cities_normalized(qnorm, _index)
+
+
+def _find(guess_text: str):
+    """Look up a raw user query (at most MAX_GUESS_LENGTH characters).
+
+    Hits go through the normalized-key cache; misses and the 'name, state'
+    fallback are looked up directly so junk queries are never memoized.
+    """
+    qnorm = normalize_name(guess_text)
+    if qnorm in _index:
+        return _find_cached(qnorm)
+    return find_cities_normalized(qnorm, _index)
+
+
+def _build_city_dict(city) -> dict:
     return {
         "name": city.name,
         "state": city.state,
@@ -44,10 +215,46 @@ def _city_to_dict(city) -> dict:
     }
 
 
+# Response dict for every loaded record, keyed by id(): records are frozen and
+# live for the whole process, so each dict is built once at startup
+_CITY_DICTS = {id(c): _build_city_dict(c) for c in get_city_arrays().records}
+
+
+def _city_to_dict(city) -> dict:
+    """Convert a CityRecord to a JSON-serializable dict.
+
+    Records from the shared index get their precomputed dict, which is shared
+    between requests and must not be modified.
+    """
+    d = _CITY_DICTS.get(id(city))
+    return d if d is not None else _build_city_dict(city)
+
+
+def _guess_result(city, miles: float, tier: str, target: _DailyTarget) -> dict:
+    """Build the "result" object of a guess response (`miles` already rounded)."""
+    is_correct = city.name_lower == target.name_lower and city.state_lower == target.state_lower
+    result = {
+        "city": _city_to_dict(city),
+        "distance_miles": miles,
+        "color_tier": tier,
+        "is_correct": is_correct,
+    }
+    # If correct, include the target info
+    if is_correct:
+        result["target"] = target.city_dict
+    return result
+
+
 @app.route("/")
 def index():
-    """Serve the main game page."""
-    return send_from_directory(STATIC_DIR, "index.html")
+    """Serve the main game page (from memory; restart to pick up edits).
+
+    Always revalidated (no-cache), answered with a bodyless 304 while the ETag matches.
+    """
+    response = app.response_class(_INDEX_HTML, mimetype="text/html")
+    response.set_etag(_INDEX_ETAG)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
 
 
 @app.route("/api/game/info")
@@ -58,8 +265,8 @@ def game_info():
     hours, remainder = divmod(total_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
     
-    return jsonify({
-        "total_cities": len(get_all_cities()),
+    response = jsonify({
+        "total_cities": _TOTAL_CITIES,
         "cst_date": get_cst_date().isoformat(),
         "time_until_reset": {
             "hours": hours,
@@ -68,6 +275,9 @@ def game_info():
             "total_seconds": total_seconds,
         },
     })
+    # The countdown changes every second; allow at most one second of reuse
+    response.headers["Cache-Control"] = "max-age=1, must-revalidate"
+    return response
 
 
 @app.route("/api/game/target-hash")
@@ -76,10 +286,20 @@ def target_hash():
     
     This allows the client to verify a win without revealing the answer.
     """
-    target = get_daily_city()
-    # Simple hash: just use the city name + state lowercased
-    target_key = f"{target.name.lower()},{target.state.lower()}"
-    return jsonify({"target_hash": hash(target_key) % 10000000})
+    return jsonify({"target_hash": _target_hash_for(get_cst_date())})
+
+
+@functools.lru_cache(maxsize=2)
+def _target_hash_for(day: date) -> int:
+    """Stable 32-bit hash of the day's "name,state" (lowercased).
+
+    Uses BLAKE2b rather than the builtin hash(), which is salted per process and
+    so differed between gunicorn workers.
+    """
+    target = get_daily_city(day)
+    target_key = f"{target.name_lower},{target.state_lower}"
+    digest = hashlib.blake2b(target_key.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "big")
 
 
 @app.route("/api/guess", methods=["POST"])
@@ -89,80 +309,148 @@ def submit_guess():
     Request body: {"guess": "city name"}
     Response: {"success": bool, "result": {...} or "error": "..."}
     """
-    data = request.get_json()
+    data = _body()
     if not data or "guess" not in data:
         return jsonify({"success": False, "error": "Missing 'guess' in request body"}), 400
+    guess_text = data["guess"]
+    if not isinstance(guess_text, str):
+        return jsonify({"success": False, "error": _GUESS_NOT_STRING}), 400
     
-    guess_text = data["guess"].strip()
+    guess_text = guess_text.strip()
     if not guess_text:
         return jsonify({"success": False, "error": "Empty guess"}), 400
+    if len(guess_text) > MAX_GUESS_LENGTH:
+        return jsonify({"success": False, "error": _GUESS_TOO_LONG}), 400
     
     # Find the guessed city
-    matches, _ = find_cities(guess_text, _index, _names)
+    matches = _find(guess_text)
     if not matches:
-        return jsonify({
-            "success": False, 
-            "error": "City not found. Make sure it's a US city with 300k+ population.",
-            "guess": guess_text,
-        })
+        return jsonify({"success": False, "error": _CITY_NOT_FOUND, "guess": guess_text})
     
     guessed_city = matches[0]
-    target = get_daily_city()
+    target = _daily_target()
     
     # Calculate distance and color tier
-    dist = distance_between_records(guessed_city, target)
-    tier = get_color_tier(dist)
-    is_correct = (
-        guessed_city.name.lower() == target.name.lower()
-        and guessed_city.state.lower() == target.state.lower()
-    )
-    
-    result = {
-        "city": _city_to_dict(guessed_city),
-        "distance_miles": round(dist, 1),
-        "color_tier": tier,
-        "is_correct": is_correct,
-    }
-    
-    # If correct, include the target info
-    if is_correct:
-        result["target"] = _city_to_dict(target)
-    
+    dist = float(target.distances[guessed_city.row])
+    result = _guess_result(guessed_city, _round_miles(dist), get_color_tier(dist), target)
     return jsonify({"success": True, "result": result})
 
 
+@app.route("/api/guess/batch", methods=["POST"])
+def submit_guess_batch():
+    """Process several guesses at once (e.g. replaying history after a reconnect).
+
+    Request body: {"guesses": ["city name", ...]}
+    Response: {"success": true, "results": [...]} where each entry has the same
+    shape as the /api/guess response body for that guess.
+    """
+    data = _body()
+    guesses = data.get("guesses") if data else None
+    if not isinstance(guesses, list):
+        return jsonify({"success": False, "error": "Missing 'guesses' list in request body"}), 400
+    if len(guesses) > MAX_BATCH_GUESSES:
+        return jsonify({"success": False, "error": f"At most {MAX_BATCH_GUESSES} guesses per batch"}), 400
+
+    # Resolve every guess first, then score all found cities in one vectorized pass
+    entries = []
+    found = []
+    for raw in guesses:
+        if not isinstance(raw, str):
+            entries.append({"success": False, "error": _GUESS_NOT_STRING, "guess": None})
+            continue
+        guess_text = raw.strip()
+        if not guess_text:
+            entries.append({"success": False, "error": "Empty guess", "guess": guess_text})
+            continue
+        if len(guess_text) > MAX_GUESS_LENGTH:
+            entries.append({"success": False, "error": _GUESS_TOO_LONG, "guess": guess_text[:MAX_GUESS_LENGTH]})
+            continue
+        matches = _find(guess_text)
+        if not matches:
+            entries.append({"success": False, "error": _CITY_NOT_FOUND, "guess": guess_text})
+            continue
+        found.append((len(entries), matches[0]))
+        entries.append(None)  # filled in below
+
+    if found:
+        target = _daily_target()
+        rows = np.fromiter((city.row for _, city in found), dtype=np.intp, count=len(found))
+        dists = target.distances[rows]
+        tiers = get_color_tiers_vectorized(dists)
+        for (pos, city), miles, tier in zip(found, _round_miles_array(dists), tiers.tolist()):
+            entries[pos] = {"success": True, "result": _guess_result(city, miles, tier, target)}
+
+    return jsonify({"success": True, "results": entries})
+
+
 @app.route("/api/reveal", methods=["POST"])
 def reveal_answer():
     """Reveal today's answer (for giving up).
     
     Request body: {"confirm": true}
     """
-    data = request.get_json()
+    data = _body()
     if not data or not data.get("confirm"):
         return jsonify({"success": False, "error": "Must confirm reveal"}), 400
     
-    target = get_daily_city()
     return jsonify({
         "success": True,
-        "target": _city_to_dict(target),
+        "target": _daily_target().city_dict,
     })
 
 
-@app.route("/api/cities")
-def list_cities():
-    """Return list of all valid city names (for autocomplete)."""
-    cities = get_all_cities()
+@app.route("/api/closest")
+def closest():
+    """Return the cities nearest to a given city.
+
+    Query params: city=<city name>, n=<how many, default 5>
+    Response: {"success": bool, "city": {...}, "closest": [{"city": {...}, "distance_miles": float}, ...]}
+    """
+    query = request.args.get("city", "").strip()
+    if not query:
+        return jsonify({"success": False, "error": "Missing 'city' query parameter"}), 400
+    if len(query) > MAX_GUESS_LENGTH:
+        return jsonify({"success": False, "error": _GUESS_TOO_LONG}), 400
+    try:
+        n = int(request.args.get("n", 5))
+    except ValueError:
+        return jsonify({"success": False, "error": "'n' must be an integer"}), 400
+    n = max(1, min(n, _TOTAL_CITIES - 1))
+
+    matches = _find(query)
+    if not matches:
+        return jsonify({"success": False, "error": _CITY_NOT_FOUND, "city": query})
+
+    city = matches[0]
     return jsonify({
-        "cities": [f"{c.name}, {c.state}" for c in cities]
+        "success": True,
+        "city": _city_to_dict(city),
+        "closest": [
+            {"city": _city_to_dict(other), "distance_miles": _round_miles(miles)}
+            for other, miles in closest_cities(city, n)
+        ],
     })
 
 
+@app.route("/api/cities")
+def list_cities():
+    """Return list of all valid city names (for autocomplete).
+
+    Sends an ETag so repeat clients get a bodyless 304 via If-None-Match.
+    """
+    response = app.response_class(_CITIES_JSON, mimetype="application/json")
+    response.set_etag(_CITIES_ETAG)
+    response.headers["Cache-Control"] = "public, max-age=86400"
+    return response.make_conditional(request)
+
+
 if __name__ == "__main__":
     # Use port 5001 to avoid conflict with macOS AirPlay Receiver (port 5000)
-    # Debug mode only for local development
+    # Debug mode (and its re-importing reloader) only when CITIDLE_DEV is set
+    dev = bool(os.environ.get("CITIDLE_DEV"))
     print("Starting Citidle web server...")
     print("Open http://localhost:5001 in your browser")
-    app.run(debug=True, host="127.0.0.1", port=5001)
+    app.run(debug=dev, host="127.0.0.1", port=5001)
 else:
-    # Production mode (gunicorn) - no debug
+    # Production mode (gunicorn --preload) - no debug
     pass